@@ -9,6 +9,7 @@ We use pyproject.toml whenever possible for settings.
 from __future__ import annotations
 
 import sys
+import sysconfig
 from glob import glob
 from itertools import chain
 from os import environ
@@ -110,6 +111,31 @@ if shims_enabled:
         for lib in extra_library_dirs:
             extmodule.extra_link_args.append(f'-Wl,-rpath,{lib}')  # type: ignore
 
+# Optional profile-guided optimization with link-time optimization (GCC).
+# Build with PIKEPDF_PGO=generate, run a training workload (see "make build-pgo"),
+# then rebuild with PIKEPDF_PGO=use to compile against the recorded profile.
+pgo_mode = environ.get('PIKEPDF_PGO', '')
+if pgo_mode:
+    # The flags and profile layout below are GCC's. clang (including Apple's
+    # "gcc") needs its profiles merged with llvm-profdata before use.
+    # Check both compilers, since C++ sources are compiled with CXX.
+    pgo_compilers = [
+        environ.get(var) or sysconfig.get_config_var(var) or '' for var in ('CC', 'CXX')
+    ]
+    if sys.platform in ('win32', 'darwin') or any('clang' in c for c in pgo_compilers):
+        raise RuntimeError('PIKEPDF_PGO is only supported with GCC')
+    pgo_dir = abspath(environ.get('PIKEPDF_PGO_DIR', join('build', 'pgo')))
+    if pgo_mode == 'generate':
+        pgo_flags = [f'-fprofile-generate={pgo_dir}', '-flto']
+    elif pgo_mode == 'use':
+        if not exists(pgo_dir):
+            raise FileNotFoundError(pgo_dir)
+        pgo_flags = [f'-fprofile-use={pgo_dir}', '-fprofile-correction', '-flto']
+    else:
+        raise ValueError(f"PIKEPDF_PGO must be 'generate' or 'use', not {pgo_mode!r}")
+    extmodule.extra_compile_args.extend(pgo_flags)  # type: ignore
+    extmodule.extra_link_args.extend(pgo_flags)  # type: ignore
+
 if __name__ == '__main__':
     with ParallelCompile('PIKEPDF_NUM_BUILD_JOBS'):  # optional envvar
         setup(
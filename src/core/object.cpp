@@ -122,6 +122,17 @@ bool array_has_item(QPDFObjectHandle haystack, QPDFObjectHandle needle)
     return false;
 }
 
+// Encode the value to search for in an Array; see __contains__ for why str is refused
+static QPDFObjectHandle array_search_value(py::object value)
+{
+    if (py::isinstance<py::str>(value) || py::isinstance<py::bytes>(value)) {
+        throw py::type_error(
+            "Searching a pikepdf.Array for str is not supported due to ambiguity. "
+            "Use pikepdf.String('...') or pikepdf.Name('...') instead.");
+    }
+    return objecthandle_encode(value);
+}
+
 QPDFObjectHandle object_get_key(QPDFObjectHandle h, std::string const &key)
 {
     ensure_keyed(h, "get", key);
@@ -280,6 +291,14 @@ void init_object(py::module_ &m)
 
     py::bind_map<ObjectMap>(m, "_ObjectMapping");
 
+    py::class_<ArrayIterator, py::smart_holder>(m, "_ArrayIterator")
+        .def(
+            "__iter__",
+            [](ArrayIterator &it) -> ArrayIterator & { return it; },
+            py::return_value_policy::reference_internal)
+        .def("__next__", &ArrayIterator::next)
+        .def("__length_hint__", &ArrayIterator::remaining);
+
 // MSVC raises a false positive warning here
 #if _MSC_VER
 #    pragma warning(suppress : 4267)
@@ -377,6 +396,10 @@ void init_object(py::module_ &m)
             [](QPDFObjectHandle &self, py::object other) -> py::object {
                 QPDFObjectHandle q_other;
                 try {
+                    if (self.isArray() && (py::isinstance<py::list>(other) ||
+                                              py::isinstance<py::tuple>(other))) {
+                        return py::bool_(array_equals_sequence(self, other));
+                    }
                     q_other = objecthandle_encode(other);
                 } catch (const py::cast_error &) {
                     // Cannot remove this construct without reaching into pybind11
@@ -395,6 +418,16 @@ void init_object(py::module_ &m)
                     return h.copyStream();
                 return h.shallowCopy();
             })
+        .def("copy",
+            [](QPDFObjectHandle &h) {
+                // Like list.copy() and dict.copy(): the container is new, but
+                // its items are shared with the original
+                if (!h.isArray() && !h.isDictionary())
+                    throw py::type_error(
+                        std::string("copy() not available on object of type ") +
+                        h.getTypeName() + "; use copy.copy()");
+                return h.shallowCopy();
+            })
         .def("__len__",
             [](QPDFObjectHandle &h) -> py::size_t {
                 if (h.isDictionary()) {
@@ -516,9 +549,15 @@ void init_object(py::module_ &m)
             },
             py::is_operator())
         // Fallback for other types (e.g., Decimal) - return NotImplemented
+        // Array + list/tuple/Array concatenates, like list
         .def(
             "__add__",
             [](QPDFObjectHandle &h, py::object other) -> py::object {
+                if (h.isArray()) {
+                    if (!is_array_concat_operand(other))
+                        return py::handle(Py_NotImplemented).cast<py::object>();
+                    return py::cast(array_concat(h, other));
+                }
                 if (!h.isInteger() && !h.isReal())
                     throw py::type_error("Object is not numeric");
                 return py::handle(Py_NotImplemented).cast<py::object>();
@@ -532,6 +571,18 @@ void init_object(py::module_ &m)
                 return py::handle(Py_NotImplemented).cast<py::object>();
             },
             py::is_operator())
+        // Array += iterable extends in place; other types fall back to
+        // __add__ by returning NotImplemented
+        .def(
+            "__iadd__",
+            [](py::object self, py::object other) -> py::object {
+                auto h = self.cast<QPDFObjectHandle>();
+                if (!h.isArray() || !is_array_extend_operand(other))
+                    return py::handle(Py_NotImplemented).cast<py::object>();
+                array_extend(h, other);
+                return self;
+            },
+            py::is_operator())
         .def(
             "__sub__",
             [](QPDFObjectHandle &h, long long other) -> long long {
@@ -870,6 +921,11 @@ void init_object(py::module_ &m)
                 auto u_index = list_range_check(h, index);
                 return h.getArrayItem(u_index);
             })
+        .def("__getitem__",
+            [](QPDFObjectHandle &h, py::slice slice) {
+                ensure_array(h, ArrayOp::slice);
+                return array_get_slice(h, slice);
+            })
         .def("__getitem__",
             [](QPDFObjectHandle &h, QPDFObjectHandle &name) {
                 return object_get_key(h, name.getName());
@@ -961,6 +1017,11 @@ void init_object(py::module_ &m)
                 auto u_index = list_range_check(h, index);
                 h.eraseItem(u_index);
             })
+        .def("__delitem__",
+            [](QPDFObjectHandle &h, py::slice slice) {
+                ensure_array(h, ArrayOp::delete_slice);
+                array_del_slice(h, slice);
+            })
         .def("__delitem__",
             [](QPDFObjectHandle &h, QPDFObjectHandle &name) {
                 object_del_key(h, name.getName());
@@ -1114,9 +1175,7 @@ void init_object(py::module_ &m)
             "__iter__",
             [](QPDFObjectHandle h) -> py::iterable {
                 if (h.isArray()) {
-                    auto vec = h.getArrayAsVector();
-                    auto pyvec = py::cast(vec);
-                    return pyvec.attr("__iter__")();
+                    return py::cast(ArrayIterator(h));
                 } else if (h.isDictionary() || h.isStream()) {
                     if (h.isStream())
                         h = h.getDict();
@@ -1188,6 +1247,12 @@ void init_object(py::module_ &m)
                 auto value = objecthandle_encode(pyvalue);
                 h.setArrayItem(u_index, value);
             })
+        .def("__setitem__",
+            [](QPDFObjectHandle &h, py::slice slice, py::iterable iterable) {
+                ensure_array(h, ArrayOp::assign_slice);
+                // Encode all items up front, so a failure leaves the array intact
+                array_set_slice(h, slice, array_builder(iterable));
+            })
         .def("__setitem__",
             [](QPDFObjectHandle &h, py::object key, py::object pyvalue) {
                 std::string k = string_from_key(key);
@@ -1200,6 +1265,60 @@ void init_object(py::module_ &m)
                 auto item = objecthandle_encode(pyitem);
                 return h.appendItem(item);
             })
+        .def(
+            "insert",
+            [](QPDFObjectHandle &h, py::ssize_t index, py::object pyitem) {
+                ensure_array(h, ArrayOp::insert);
+                array_insert(h, index, objecthandle_encode(pyitem));
+            },
+            py::arg("index"),
+            py::arg("obj"))
+        .def(
+            "pop",
+            [](QPDFObjectHandle &h, py::ssize_t index) {
+                ensure_array(h, ArrayOp::pop);
+                return array_pop(h, index);
+            },
+            py::arg("index") = -1)
+        .def("reverse",
+            [](QPDFObjectHandle &h) {
+                ensure_array(h, ArrayOp::reverse);
+                array_reverse(h);
+            })
+        .def(
+            "count",
+            [](QPDFObjectHandle &h, py::object value) {
+                ensure_array(h, ArrayOp::count);
+                return array_count(h, array_search_value(value));
+            },
+            py::arg("value"))
+        .def(
+            "index",
+            [](QPDFObjectHandle &h,
+                py::object value,
+                py::ssize_t start,
+                py::ssize_t stop) {
+                ensure_array(h, ArrayOp::index);
+                return array_index(h, array_search_value(value), start, stop);
+            },
+            py::arg("value"),
+            py::arg("start") = 0,
+            py::arg("stop") = PY_SSIZE_T_MAX)
+        .def(
+            "remove",
+            [](QPDFObjectHandle &h, py::object value) {
+                ensure_array(h, ArrayOp::remove);
+                array_remove(h, array_search_value(value));
+            },
+            py::arg("value"))
+        .def("sort",
+            [](QPDFObjectHandle &h) {
+                ensure_array(h, ArrayOp::sort);
+                throw py::notimpl_error(
+                    "pikepdf.Array does not support sort(), because PDF objects have "
+                    "no natural ordering. Use sorted() with a key function and "
+                    "assign the result with a[:] = ...");
+            })
         .def("extend",
             [](QPDFObjectHandle &h, py::iterable iter) {
                 for (auto item : iter) {
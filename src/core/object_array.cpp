@@ -0,0 +1,359 @@
+// SPDX-FileCopyrightText: 2025 James R. Barlow
+// SPDX-License-Identifier: MPL-2.0
+
+/*
+ * List-like operations on Array objects
+ */
+
+#include <algorithm>
+#include <iterator>
+#include <string>
+#include <vector>
+
+#include <qpdf/Constants.h>
+#include <qpdf/QPDFObjectHandle.hh>
+
+#include <pybind11/pybind11.h>
+
+#include "pikepdf.h"
+
+// Indexed by ArrayOp; keep in the same order
+static const char *const array_op_messages[] = {
+    "pikepdf.Object is not an Array: cannot slice",
+    "pikepdf.Object is not an Array: cannot assign slice of",
+    "pikepdf.Object is not an Array: cannot delete slice of",
+    "pikepdf.Object is not an Array: cannot insert into",
+    "pikepdf.Object is not an Array: cannot pop from",
+    "pikepdf.Object is not an Array: cannot reverse",
+    "pikepdf.Object is not an Array: cannot count items in",
+    "pikepdf.Object is not an Array: cannot search",
+    "pikepdf.Object is not an Array: cannot remove items from",
+    "pikepdf.Object is not an Array: cannot sort",
+};
+static_assert(std::size(array_op_messages) == static_cast<size_t>(ArrayOp::sort) + 1,
+    "array_op_messages must have one entry per ArrayOp");
+
+void ensure_array(QPDFObjectHandle &h, ArrayOp op)
+{
+    if (!h.isArray()) {
+        // Format the message straight into the exception rather than building a
+        // std::string first; code probing objects with try/except may hit this
+        // often. Python still allocates the message and exception objects.
+        PyErr_Format(PyExc_TypeError,
+            "%s object of type %s",
+            array_op_messages[static_cast<int>(op)],
+            h.getTypeName());
+        throw py::error_already_set();
+    }
+}
+
+/*
+ * Resolve a slice against the array's length, returning the slice length.
+ *
+ * This is what slice.indices() does, but through the C API directly.
+ */
+static py::ssize_t array_slice_indices(QPDFObjectHandle &h,
+    py::slice slice,
+    py::ssize_t &start,
+    py::ssize_t &stop,
+    py::ssize_t &step)
+{
+    if (PySlice_Unpack(slice.ptr(), &start, &stop, &step) < 0)
+        throw py::error_already_set();
+    return PySlice_AdjustIndices(
+        static_cast<py::ssize_t>(h.getArrayNItems()), &start, &stop, step);
+}
+
+// True for a[:], which copies or replaces the whole array
+static bool is_full_slice(py::slice slice)
+{
+    auto *s = reinterpret_cast<PySliceObject *>(slice.ptr());
+    return s->start == Py_None && s->stop == Py_None && s->step == Py_None;
+}
+
+/*
+ * Replace items [start, stop) of the array with new_items.
+ *
+ * qpdf only lets us insert or erase one item at a time, and each of those
+ * shifts the tail of the array. Instead, take a copy of the items, shift the
+ * tail once to open (or close) a gap of the right size, fill the gap, and
+ * write the whole vector back.
+ */
+void array_splice(QPDFObjectHandle &h,
+    size_t start,
+    size_t stop,
+    std::vector<QPDFObjectHandle> const &new_items)
+{
+    auto items = h.getArrayAsVector();
+    auto old_n = items.size();
+    auto removed = stop - start;
+    auto added = new_items.size();
+
+    if (added > removed) {
+        items.resize(old_n + (added - removed));
+        std::move_backward(items.begin() + stop, items.begin() + old_n, items.end());
+    } else if (added < removed) {
+        auto new_end =
+            std::move(items.begin() + stop, items.end(), items.begin() + start + added);
+        items.erase(new_end, items.end());
+    }
+    std::copy(new_items.begin(), new_items.end(), items.begin() + start);
+    h.setArrayFromVector(items);
+}
+
+QPDFObjectHandle array_get_slice(QPDFObjectHandle &h, py::slice slice)
+{
+    if (is_full_slice(slice))
+        return h.shallowCopy();
+
+    py::ssize_t start, stop, step;
+    auto slicelength = array_slice_indices(h, slice, start, stop, step);
+
+    std::vector<QPDFObjectHandle> result;
+    result.reserve(slicelength);
+    for (py::ssize_t i = 0, k = start; i < slicelength; ++i, k += step) {
+        result.push_back(h.getArrayItem(static_cast<int>(k)));
+    }
+    return QPDFObjectHandle::newArray(result);
+}
+
+void array_set_slice(QPDFObjectHandle &h,
+    py::slice slice,
+    std::vector<QPDFObjectHandle> const &new_items)
+{
+    if (is_full_slice(slice)) {
+        h.setArrayFromVector(new_items);
+        return;
+    }
+
+    py::ssize_t start, stop, step;
+    auto slicelength = array_slice_indices(h, slice, start, stop, step);
+
+    if (step != 1) {
+        // For an extended slice we must replace an equal number of items
+        if (new_items.size() != static_cast<size_t>(slicelength)) {
+            throw py::value_error(std::string("attempt to assign sequence of length ") +
+                                  std::to_string(new_items.size()) +
+                                  std::string(" to extended slice of size ") +
+                                  std::to_string(slicelength));
+        }
+        for (py::ssize_t i = 0; i < slicelength; ++i) {
+            h.setArrayItem(static_cast<int>(start + i * step), new_items.at(i));
+        }
+        return;
+    }
+
+    // For simple slices, the replacement may differ in size. As with list,
+    // a[3:1] = ... inserts at index 3.
+    stop = std::max(start, stop);
+    array_splice(h, static_cast<size_t>(start), static_cast<size_t>(stop), new_items);
+}
+
+void array_del_slice(QPDFObjectHandle &h, py::slice slice)
+{
+    py::ssize_t start, stop, step;
+    auto slicelength = array_slice_indices(h, slice, start, stop, step);
+    if (slicelength == 0)
+        return;
+    if (step < 0) {
+        // Visit the same indexes in ascending order
+        start += (slicelength - 1) * step;
+        step = -step;
+    }
+
+    // Compact the survivors towards the front in one pass, so each item moves
+    // at most once, rather than erasing one item (and shifting the tail) at a time
+    auto items = h.getArrayAsVector();
+    auto n = static_cast<py::ssize_t>(items.size());
+    py::ssize_t write = start;
+    py::ssize_t next_deleted = start;
+    py::ssize_t deleted = 0;
+    for (py::ssize_t read = start; read < n; ++read) {
+        if (deleted < slicelength && read == next_deleted) {
+            ++deleted;
+            next_deleted += step;
+            continue;
+        }
+        if (write != read)
+            items[write] = std::move(items[read]);
+        ++write;
+    }
+    items.resize(static_cast<size_t>(write));
+    h.setArrayFromVector(items);
+}
+
+void array_insert(QPDFObjectHandle &h, py::ssize_t index, QPDFObjectHandle item)
+{
+    auto n = static_cast<py::ssize_t>(h.getArrayNItems());
+    // Same clamping rules as list.insert: out of range indexes insert at the ends.
+    // Written with min/max so the compiler can emit conditional moves.
+    if (index < 0)
+        index += n;
+    index = std::max<py::ssize_t>(0, std::min(index, n));
+    h.insertItem(static_cast<int>(index), item);
+}
+
+QPDFObjectHandle array_pop(QPDFObjectHandle &h, py::ssize_t index)
+{
+    auto n = static_cast<py::ssize_t>(h.getArrayNItems());
+    if (n == 0)
+        throw py::index_error("pop from empty array");
+    if (index < 0)
+        index += n;
+    if (index < 0 || index >= n)
+        throw py::index_error("pop index out of range");
+    auto item = h.getArrayItem(static_cast<int>(index));
+    h.eraseItem(static_cast<int>(index));
+    return item;
+}
+
+void array_reverse(QPDFObjectHandle &h)
+{
+    auto items = h.getArrayAsVector();
+    std::reverse(items.begin(), items.end());
+    h.setArrayFromVector(items);
+}
+
+/*
+ * Equality test for the Array searches, set up once per search.
+ *
+ * Names are the most common search target. For them, fetch the target's
+ * name once and compare with isNameAndEquals, skipping the recursion guard
+ * and cycle tracking that objecthandle_equal sets up on every call.
+ *
+ * For other targets, items whose type code can never compare equal to the
+ * target's are rejected on the type code alone, before objecthandle_equal.
+ */
+class ArrayItemMatcher {
+public:
+    ArrayItemMatcher(QPDFObjectHandle needle)
+        : needle(needle), needle_typecode(needle.getTypeCode()),
+          needle_is_name(needle.isName()),
+          needle_is_numeric(typecode_is_numeric(needle_typecode))
+    {
+        if (this->needle_is_name)
+            this->needle_name = needle.getName();
+    }
+    bool operator()(QPDFObjectHandle item)
+    {
+        if (this->needle_is_name)
+            return item.isNameAndEquals(this->needle_name);
+        auto typecode = item.getTypeCode();
+        if (typecode != this->needle_typecode &&
+            !(this->needle_is_numeric && typecode_is_numeric(typecode)))
+            return false;
+        return objecthandle_equal(item, this->needle);
+    }
+
+private:
+    QPDFObjectHandle needle;
+    qpdf_object_type_e needle_typecode;
+    bool needle_is_name;
+    bool needle_is_numeric;
+    std::string needle_name;
+};
+
+py::ssize_t array_count(QPDFObjectHandle &h, QPDFObjectHandle needle)
+{
+    ArrayItemMatcher matches(needle);
+    py::ssize_t count = 0;
+    for (auto &item : h.aitems()) {
+        if (matches(item))
+            ++count;
+    }
+    return count;
+}
+
+py::ssize_t array_index(
+    QPDFObjectHandle &h, QPDFObjectHandle needle, py::ssize_t start, py::ssize_t stop)
+{
+    auto n = static_cast<py::ssize_t>(h.getArrayNItems());
+    // Same bounds rules as list.index
+    if (start < 0)
+        start += n;
+    if (stop < 0)
+        stop += n;
+    start = std::max<py::ssize_t>(0, start);
+    stop = std::min(stop, n);
+    ArrayItemMatcher matches(needle);
+    for (auto i = start; i < stop; ++i) {
+        if (matches(h.getArrayItem(static_cast<int>(i))))
+            return i;
+    }
+    throw py::value_error("item not in array");
+}
+
+void array_remove(QPDFObjectHandle &h, QPDFObjectHandle needle)
+{
+    auto index = array_index(h, needle, 0, PY_SSIZE_T_MAX);
+    h.eraseItem(static_cast<int>(index));
+}
+
+QPDFObjectHandle ArrayIterator::next()
+{
+    if (this->index >= this->items.size())
+        throw py::stop_iteration();
+    return this->items[this->index++];
+}
+
+// As with list, only other sequences may be concatenated with an Array
+bool is_array_concat_operand(py::handle other)
+{
+    if (py::isinstance<py::list>(other) || py::isinstance<py::tuple>(other))
+        return true;
+    if (py::isinstance<QPDFObjectHandle>(other))
+        return other.cast<QPDFObjectHandle>().isArray();
+    return false;
+}
+
+// As with list, += extends with any iterable; str and bytes are rejected, as
+// it is ambiguous whether they are meant as one String or as their characters
+bool is_array_extend_operand(py::handle other)
+{
+    if (py::isinstance<py::str>(other) || py::isinstance<py::bytes>(other))
+        return false;
+    return py::isinstance<py::iterable>(other);
+}
+
+QPDFObjectHandle array_concat(QPDFObjectHandle &h, py::iterable other)
+{
+    auto extra = array_builder(other);
+    std::vector<QPDFObjectHandle> result;
+    result.reserve(static_cast<size_t>(h.getArrayNItems()) + extra.size());
+    for (auto &item : h.aitems()) {
+        result.push_back(item);
+    }
+    result.insert(result.end(), extra.begin(), extra.end());
+    return QPDFObjectHandle::newArray(result);
+}
+
+void array_extend(QPDFObjectHandle &h, py::iterable other)
+{
+    // Encode everything first, so that a += [x, y] with x == a works, and
+    // so a failed conversion does not leave the array half-extended
+    auto extra = array_builder(other);
+    for (auto &item : extra) {
+        h.appendItem(item);
+    }
+}
+
+/*
+ * Compare an Array with a list or tuple, item by item.
+ *
+ * Sequences of a different length are unequal without looking at any items,
+ * and items are converted one at a time, stopping at the first mismatch,
+ * rather than converting the whole sequence to an Array first.
+ */
+bool array_equals_sequence(QPDFObjectHandle &h, py::sequence other)
+{
+    // Snapshot, since converting items can run arbitrary Python code
+    auto items = h.getArrayAsVector();
+    if (py::len(other) != items.size())
+        return false;
+    for (size_t i = 0; i < items.size(); ++i) {
+        py::object value = other[i];
+        if (!objecthandle_equal(items[i], objecthandle_encode(value)))
+            return false;
+    }
+    return true;
+}
@@ -42,6 +42,12 @@ std::vector<QPDFObjectHandle> array_builder(const py::iterable iter)
     StackGuard sg(" array_builder");
     std::vector<QPDFObjectHandle> result;
 
+    // Lists, tuples, ranges and Arrays know their length, so allocate once
+    auto hint = PyObject_LengthHint(iter.ptr(), 0);
+    if (hint < 0)
+        throw py::error_already_set();
+    result.reserve(static_cast<size_t>(hint));
+
     for (const auto &item : iter) {
         result.emplace_back(objecthandle_encode(item));
     }
@@ -72,6 +78,16 @@ QPDFObjectHandle objecthandle_encode(const py::handle handle)
     if (handle.is_none())
         return QPDFObjectHandle::newNull();
 
+    // Fast path for plain ints, e.g. from Array(range(n)) or lists of
+    // coordinates, which would otherwise fail a cast to QPDFObjectHandle first.
+    // bool and other int subclasses are not exact and take the general path.
+    if (PyLong_CheckExact(handle.ptr())) {
+        int overflow = 0;
+        auto value = PyLong_AsLongLongAndOverflow(handle.ptr(), &overflow);
+        if (!overflow)
+            return QPDFObjectHandle::newInteger(value);
+    }
+
     // Ensure that when we return QPDFObjectHandle/pikepdf.Object to the Py
     // environment, that we can recover it
     try {
@@ -17,13 +17,6 @@ inline bool typecode_is_int(qpdf_object_type_e typecode)
     return typecode == qpdf_object_type_e::ot_integer;
 }
 
-inline bool typecode_is_numeric(qpdf_object_type_e typecode)
-{
-    return typecode == qpdf_object_type_e::ot_integer ||
-           typecode == qpdf_object_type_e::ot_real ||
-           typecode == qpdf_object_type_e::ot_boolean;
-}
-
 static std::pair<std::string, std::string> make_unparsed_pair(
     QPDFObjectHandle &self, QPDFObjectHandle &other)
 {
@@ -133,9 +133,66 @@ void init_qpdf(py::module_ &m);
 size_t list_range_check(QPDFObjectHandle h, int index);
 void init_object(py::module_ &m);
 
+// From object_array.cpp
+// Array operations, used to select ensure_array's error message
+enum class ArrayOp {
+    slice,
+    assign_slice,
+    delete_slice,
+    insert,
+    pop,
+    reverse,
+    count,
+    index,
+    remove,
+    sort, // Keep last; object_array.cpp checks its message table against it
+};
+void ensure_array(QPDFObjectHandle &h, ArrayOp op);
+void array_splice(QPDFObjectHandle &h,
+    size_t start,
+    size_t stop,
+    std::vector<QPDFObjectHandle> const &new_items);
+QPDFObjectHandle array_get_slice(QPDFObjectHandle &h, py::slice slice);
+void array_set_slice(QPDFObjectHandle &h,
+    py::slice slice,
+    std::vector<QPDFObjectHandle> const &new_items);
+void array_del_slice(QPDFObjectHandle &h, py::slice slice);
+void array_insert(QPDFObjectHandle &h, py::ssize_t index, QPDFObjectHandle item);
+QPDFObjectHandle array_pop(QPDFObjectHandle &h, py::ssize_t index);
+void array_reverse(QPDFObjectHandle &h);
+py::ssize_t array_count(QPDFObjectHandle &h, QPDFObjectHandle needle);
+py::ssize_t array_index(
+    QPDFObjectHandle &h, QPDFObjectHandle needle, py::ssize_t start, py::ssize_t stop);
+void array_remove(QPDFObjectHandle &h, QPDFObjectHandle needle);
+bool is_array_concat_operand(py::handle other);
+bool is_array_extend_operand(py::handle other);
+QPDFObjectHandle array_concat(QPDFObjectHandle &h, py::iterable other);
+void array_extend(QPDFObjectHandle &h, py::iterable other);
+bool array_equals_sequence(QPDFObjectHandle &h, py::sequence other);
+
+// Iterates over a snapshot of an Array's items
+class ArrayIterator { // LCOV_EXCL_LINE
+public:
+    ArrayIterator(QPDFObjectHandle &h) : items(h.getArrayAsVector()), index(0) {};
+    QPDFObjectHandle next();
+    size_t remaining() const { return this->items.size() - this->index; };
+
+private:
+    std::vector<QPDFObjectHandle> items;
+    size_t index;
+};
+
 // From object_equality.cpp
 bool objecthandle_equal(QPDFObjectHandle self, QPDFObjectHandle other);
 
+// Numeric types compare equal across types, e.g. 1 == 1.0 == True
+inline bool typecode_is_numeric(qpdf_object_type_e typecode)
+{
+    return typecode == qpdf_object_type_e::ot_integer ||
+           typecode == qpdf_object_type_e::ot_real ||
+           typecode == qpdf_object_type_e::ot_boolean;
+}
+
 // From object_repr.cpp
 std::string objecthandle_scalar_value(QPDFObjectHandle h);
 std::string objecthandle_pythonic_typename(QPDFObjectHandle h);
@@ -455,6 +455,13 @@ class Object:
     @overload
     def as_decimal(self, default: T) -> Decimal | T: ...
     def _get_real_value(self) -> str: ...
+    def copy(self: T) -> T:
+        """Return a shallow copy of a pikepdf.Array or pikepdf.Dictionary.
+
+        The new container holds the same items as the original.
+        """
+    def count(self, value: Any) -> int:
+        """Count the items of a pikepdf.Array that are equal to *value*."""
     def emplace(self, other: Object, retain: Iterable[Name] = ...) -> None:
         """Copy all items from other without making a new object.
 
@@ -507,6 +514,16 @@ class Object:
         """Return a buffer protocol buffer describing the raw, encoded stream."""
     def get_stream_buffer(self, decode_level: StreamDecodeLevel = ...) -> Buffer:
         """Return a buffer protocol buffer describing the decoded stream."""
+    def index(self, value: Any, start: int = 0, stop: int = ...) -> int:
+        """Return the index of the first item of a pikepdf.Array equal to *value*.
+
+        Raises ValueError if there is no such item.
+        """
+    def insert(self, index: int, obj: Any) -> None:
+        """Insert an object into a pikepdf.Array before *index*.
+
+        As with ``list.insert``, an index past either end inserts at that end.
+        """
     def is_owned_by(self, possible_owner: Pdf) -> bool:
         """Test if this object is owned by the indicated *possible_owner*."""
     def items(self) -> Iterable[tuple[str, Object]]: ...
@@ -515,12 +532,24 @@ class Object:
     @staticmethod
     def parse(stream: bytes, description: str = ...) -> Object:
         """Parse PDF binary representation into PDF objects."""
+    def pop(self, index: int = -1) -> Object:
+        """Remove and return the item of a pikepdf.Array at *index* (default last)."""
     def read_bytes(self, decode_level: StreamDecodeLevel = ...) -> bytes:
         """Decode and read the content stream associated with this object."""
     def read_raw_bytes(self) -> bytes:
         """Read the content stream associated with a Stream, without decoding."""
+    def remove(self, value: Any) -> None:
+        """Remove the first item of a pikepdf.Array that is equal to *value*."""
+    def reverse(self) -> None:
+        """Reverse the items of a pikepdf.Array in place."""
     def same_owner_as(self, other: Object) -> bool:
         """Test if two objects are owned by the same :class:`pikepdf.Pdf`."""
+    def sort(self) -> None:
+        """Not supported; PDF objects have no natural ordering.
+
+        Raises NotImplementedError for arrays. Use ``sorted()`` with a key function
+        and assign the result back with ``a[:] = ...``.
+        """
     def to_json(self, dereference: bool = ..., schema_version: int = ...) -> bytes:
         r"""Convert to a qpdf JSON representation of the object.
 
@@ -632,7 +661,10 @@ class Object:
     def __contains__(self, obj: Object | str) -> bool: ...
     def __copy__(self) -> Object: ...
     def __delattr__(self, name: str) -> None: ...
+    @overload
     def __delitem__(self, name: str | Name | int) -> None: ...
+    @overload
+    def __delitem__(self, index: slice) -> None: ...
     def __dir__(self) -> list: ...
     def __eq__(self, other: Any) -> bool: ...
     def __float__(self) -> float: ...
@@ -642,9 +674,15 @@ class Object:
     def __getitem__(self, name: str | Name | int) -> Object: ...
     @overload
     def __getitem__(self, path: _NamePath) -> Object: ...
+    @overload
+    def __getitem__(self, index: slice) -> Array: ...
     def __hash__(self) -> int: ...
     def __int__(self) -> int: ...
+    @overload
     def __add__(self, other: int) -> int: ...
+    @overload
+    def __add__(self, other: Iterable[Any]) -> Array: ...
+    def __iadd__(self: T, other: Iterable[Any]) -> T: ...
     def __radd__(self, other: int) -> int: ...
     def __sub__(self, other: int) -> int: ...
     def __rsub__(self, other: int) -> int: ...
@@ -664,6 +702,8 @@ class Object:
     def __setitem__(self, name: str | Name | int, value: Any) -> None: ...
     @overload
     def __setitem__(self, path: _NamePath, value: Any) -> None: ...
+    @overload
+    def __setitem__(self, index: slice, value: Iterable[Any]) -> None: ...
     @property
     def _objgen(self) -> tuple[int, int]: ...
     @property
@@ -714,6 +754,11 @@ class ObjectHelper:
     def obj(self) -> Dictionary:
         """Get the underlying PDF object (typically a Dictionary)."""
 
+class _ArrayIterator:
+    def __iter__(self) -> _ArrayIterator: ...
+    def __next__(self) -> Object: ...
+    def __length_hint__(self) -> int: ...
+
 class _ObjectList:
     """A list whose elements are always pikepdf.Object.
 
@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import json
+import operator
 import sys
 from copy import copy
 from decimal import Decimal, InvalidOperation
@@ -197,12 +198,29 @@ class TestArray:
         a = pikepdf.Array(array)
         assert a == array
 
+    def test_array_of_ints(self):
+        a = Array(range(-3, 3))
+        assert a == [-3, -2, -1, 0, 1, 2]
+        b = Array([True, 1, 2**40])
+        assert b[0] is True
+        assert b[2] == 2**40
+
     def test_array_of_array(self):
         a = Array([1, 2])
         a2 = Array(a)
         assert a == a2
         assert a is not a2
 
+    def test_array_eq_sequence(self):
+        a = Array([1, Name.Foo, [2, 3]])
+        assert a == [1, Name.Foo, [2, 3]]
+        assert a == (1, Name.Foo, (2, 3))
+        assert a != [1, Name.Foo]
+        assert a != [1, Name.Bar, [2, 3]]
+        assert Array() == []
+        assert Array() != [1]
+        assert a != [1, Name.Foo, object()]
+
     def test_array_of_primitives_eq(self):
         a = Array([True, False, 0, 1, 42, 42.42])
         b = Array([True, False, 0, 1, 42, 42.42])
@@ -261,6 +279,179 @@ class TestArray:
         assert bool(pikepdf.Array([1, 2, 3])) is True
         assert bool(pikepdf.Array([])) is False
 
+    def test_slice_setitem(self):
+        a = Array([0, 1, 2, 3])
+        a[1:2] = [10, 11, 12]
+        assert a == [0, 10, 11, 12, 2, 3]
+        a[1:4] = []
+        assert a == [0, 2, 3]
+        a[3:1] = [Name.Foo]
+        assert a == [0, 2, 3, Name.Foo]
+        a[::2] = [7, 8]
+        assert a == [7, 2, 8, Name.Foo]
+        with pytest.raises(ValueError, match='extended slice of size 2'):
+            a[::2] = [1, 2, 3]
+        with pytest.raises(TypeError, match='not an Array'):
+            Dictionary()[0:1] = [1]
+
+    def test_full_slice(self):
+        c = Array([1, 2, 3])
+        d = c[:]
+        assert d == c
+        d.append(4)
+        assert c == [1, 2, 3]
+        c[:] = Array([7, 8])
+        assert c == [7, 8]
+        c[:] = c
+        assert c == [7, 8]
+
+    @pytest.mark.parametrize(
+        'sl', [slice(1, 4), slice(None, None, 2), slice(None, None, -1), slice(5, 1)]
+    )
+    def test_slice_delitem(self, sl):
+        a = Array(range(7))
+        expected = list(range(7))
+        del a[sl]
+        del expected[sl]
+        assert a == expected
+
+    def test_insert_pop(self):
+        a = Array([1, 2])
+        a.insert(1, Name.Foo)
+        assert a == [1, Name.Foo, 2]
+        a.insert(-100, 0)
+        a.insert(100, 3)
+        assert a == [0, 1, Name.Foo, 2, 3]
+        assert a.pop() == 3
+        assert a.pop(0) == 0
+        assert a.pop(-2) == Name.Foo
+        assert a == [1, 2]
+        with pytest.raises(IndexError, match='pop index out of range'):
+            a.pop(2)
+        with pytest.raises(IndexError, match='pop from empty array'):
+            Array().pop()
+        with pytest.raises(TypeError, match='cannot insert into'):
+            Name.Foo.insert(0, 1)
+
+    def test_getitem_slice(self):
+        a = Array(range(6))
+        assert isinstance(a[1:4], Array)
+        assert list(a[1:4]) == [1, 2, 3]
+        assert list(a[::2]) == [0, 2, 4]
+        assert list(a[::-1]) == [5, 4, 3, 2, 1, 0]
+        assert list(a[10:]) == []
+        b = a[:]
+        b[0] = 42
+        assert a[0] == 0
+
+    def test_reverse(self):
+        a = Array([1, Name.Foo, 3])
+        a.reverse()
+        assert a == [3, Name.Foo, 1]
+        for items in ([], [1]):
+            a = Array(items)
+            a.reverse()
+            assert list(a) == items
+
+    def test_search(self):
+        a = Array([1, Name.Foo, 2, Name.Foo, 1.0])
+        assert a.count(Name.Foo) == 2
+        assert a.count(1) == 2
+        assert a.count(42) == 0
+        assert a.index(Name.Foo) == 1
+        assert a.index(Name.Foo, 2) == 3
+        assert a.index(1, -2) == 4
+        with pytest.raises(ValueError, match='item not in array'):
+            a.index(Name.Foo, 0, 1)
+        a.remove(Name.Foo)
+        assert a == [1, 2, Name.Foo, 1.0]
+        with pytest.raises(ValueError, match='item not in array'):
+            a.remove(42)
+        with pytest.raises(TypeError, match='ambiguity'):
+            a.count('/Foo')
+
+    def test_iter(self):
+        a = Array([1, Name.Foo, 3])
+        it = iter(a)
+        assert iter(it) is it
+        assert operator.length_hint(it) == 3
+        next(it)
+        assert operator.length_hint(it) == 2
+        assert list(it) == [Name.Foo, 3]
+        assert list(it) == []
+        assert [x for x in Array()] == []
+
+    def test_addition_operators(self):
+        a = Array([1])
+        b = a + [2]
+        assert b == [1, 2]
+        assert a == [1]
+        assert a + (2, 3) + Array([4]) == [1, 2, 3, 4]
+        before = a
+        a += [2]
+        assert a is before
+        assert a == [1, 2]
+        a += a
+        assert a == [1, 2, 1, 2]
+        a += range(3)
+        a += (x for x in [Name.Foo])
+        assert a == [1, 2, 1, 2, 0, 1, 2, Name.Foo]
+        with pytest.raises(TypeError):
+            a + 'abc'
+        with pytest.raises(TypeError):
+            a + range(3)
+        with pytest.raises(TypeError):
+            a += 'abc'
+        with pytest.raises(TypeError):
+            a += 3
+
+    def test_addition_operators_typing(self, tmp_path):
+        mypy_api = pytest.importorskip('mypy.api')
+        source = tmp_path / 'array_typing.py'
+        source.write_text(
+            'from pikepdf import Array\n'
+            'a = Array([1])\n'
+            'a += [2]\n'
+            'b: Array = a + [3]\n'
+            'c: Array = a.copy()\n'
+        )
+        stdout, _, status = mypy_api.run(
+            ['--no-incremental', '--cache-dir', str(tmp_path / 'cache'), str(source)]
+        )
+        assert status == 0, stdout
+
+    def test_copy_is_shallow(self):
+        inner = Array([1])
+        a = Array([inner, 2])
+        b = a.copy()
+        assert b == a
+        b[1] = 3
+        assert a[1] == 2
+        b[0].append(42)
+        assert a[0] == [1, 42]
+
+        d = Dictionary(A=inner)
+        d2 = d.copy()
+        d2.B = 1
+        assert '/B' not in d
+        assert d2.A == inner
+        with pytest.raises(TypeError, match='copy'):
+            Name.Foo.copy()
+
+    def test_sort_not_implemented(self):
+        with pytest.raises(NotImplementedError, match='no natural ordering'):
+            Array([2, 1]).sort()
+
+    @pytest.mark.parametrize('obj', [Dictionary(), Name.Foo])
+    def test_ensure_array_error_messages(self, obj):
+        typename = obj._type_name
+        with pytest.raises(
+            TypeError, match=f"cannot pop from object of type {typename}"
+        ):
+            obj.pop()
+        with pytest.raises(TypeError, match=f"cannot sort object of type {typename}"):
+            obj.sort()
+
 
 def test_no_len():
     with pytest.raises(TypeError):